@@ -1,8 +1,21 @@
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.typing import ConfigType
+from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from .const import DOMAIN, CONF_DEVICE_PATH
+# Home Assistant is only imported for type checking so that the
+# multiplexer can run from this package on hosts without Home Assistant
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    DOMAIN,
+    CONF_DEVICE_PATH,
+    DATA_MANAGER,
+    DATA_COORDINATOR,
+    DATA_READY,
+    DATA_SETUP_TASK,
+    SERVICE_APPLY_SCENE,
+)
 import json
 import logging
 
@@ -19,4 +32,22 @@ async def async_setup_entry(
         hass.config_entries.async_forward_entry_setup(entry, "cover")
     )
     
-    return True
\ No newline at end of file
+    return True
+
+
+async def async_unload_entry(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> bool:
+    unloaded = await hass.config_entries.async_forward_entry_unload(entry, "cover")
+    if unloaded:
+        data = hass.data[DOMAIN]
+        setupTask = data.pop(DATA_SETUP_TASK, None)
+        if setupTask is not None:
+            setupTask.cancel()
+        manager = data.pop(DATA_MANAGER, None)
+        if manager is not None:
+            manager.close()
+        data.pop(DATA_COORDINATOR, None)
+        data.pop(DATA_READY, None)
+        hass.services.async_remove(DOMAIN, SERVICE_APPLY_SCENE)
+    return unloaded
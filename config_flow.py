@@ -39,13 +39,20 @@ class CommeoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._device_path = None
         self._radio_type = None
         self._title = None
+        self._ports = None
+
+    async def _async_get_ports(self):
+        """Enumerate the serial ports once per flow."""
+        if self._ports is None:
+            self._ports = await self.hass.async_add_executor_job(serial.tools.list_ports.comports)
+        return self._ports
 
     async def async_step_user(self, user_input=None):
         """Handle a zha config flow start."""
         if self._async_current_entries():
             return self.async_abort(reason="single_instance_allowed")
 
-        ports = await self.hass.async_add_executor_job(serial.tools.list_ports.comports)
+        ports = await self._async_get_ports()
         list_of_ports = [
             f"{p}, s/n: {p.serial_number or 'n/a'}"
             + (f" - {p.manufacturer}" if p.manufacturer else "")
@@ -56,6 +63,8 @@ class CommeoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             user_selection = user_input[CONF_DEVICE_PATH]
+            if user_selection == CONF_MANUAL_PATH:
+                return await self.async_step_manual()
 
             port = ports[list_of_ports.index(user_selection)]
             dev_path = await self.hass.async_add_executor_job(
@@ -71,6 +80,16 @@ class CommeoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(step_id="user", data_schema=schema)
 
 
+    async def async_step_manual(self, user_input=None):
+        """Enter a device path or a socket://host:port URL of a multiplexer."""
+        if user_input is not None:
+            return self.async_create_entry(title="Commeo Cover",data={CONF_DEVICE_PATH: user_input[CONF_DEVICE_PATH]},
+        )
+
+        schema = vol.Schema({vol.Required(CONF_DEVICE_PATH): str})
+        return self.async_show_form(step_id="manual", data_schema=schema)
+
+
     async def async_step_usb(self, discovery_info: usb.UsbServiceInfo) -> FlowResult:
         """Handle usb discovery."""
         vid = discovery_info.vid
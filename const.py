@@ -2,3 +2,24 @@
 
 DOMAIN = "commeo"
 CONF_DEVICE_PATH = "path"
+DATA_MANAGER = "manager"
+DATA_COORDINATOR = "coordinator"
+DATA_READY = "ready"
+DATA_SETUP_TASK = "setup_task"
+
+# seconds to wait for actor discovery before retrying, and between retries
+DISCOVERY_TIMEOUT = 30
+SETUP_RETRY_DELAY = 10
+SETUP_RETRY_MAX_DELAY = 300
+
+ATTR_TIMEOUT = "timeout"
+ATTR_MOVES = "moves"
+ATTR_POSITIONS = "positions"
+
+EVENT_POSITION_HISTORY = "commeo_position_history"
+
+SERVICE_MOVE_AND_WAIT = "move_and_wait"
+SERVICE_GET_POSITION_HISTORY = "get_position_history"
+SERVICE_APPLY_SCENE = "apply_scene"
+
+DEFAULT_MULTIPLEXER_PORT = 7000
@@ -1,10 +1,12 @@
 """Example integration using DataUpdateCoordinator."""
 from typing import Dict, Set
 from datetime import timedelta
+import asyncio
 import logging
 import json
 
 import async_timeout
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntries, ConfigEntry
 
 from homeassistant.core import HomeAssistant, callback
@@ -17,15 +19,40 @@ from homeassistant.components.cover import (
     SUPPORT_SET_POSITION,
     ATTR_POSITION
 )
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import DOMAIN, CONF_DEVICE_PATH
-from .serial import CommeoSerialManager, ShutterStatusResponse, ShutterResponse
+from .const import (
+    DOMAIN,
+    CONF_DEVICE_PATH,
+    DATA_MANAGER,
+    DATA_COORDINATOR,
+    DATA_READY,
+    DATA_SETUP_TASK,
+    DISCOVERY_TIMEOUT,
+    SETUP_RETRY_DELAY,
+    SETUP_RETRY_MAX_DELAY,
+    SERVICE_MOVE_AND_WAIT,
+    SERVICE_APPLY_SCENE,
+    SERVICE_GET_POSITION_HISTORY,
+    ATTR_TIMEOUT,
+    ATTR_MOVES,
+    ATTR_POSITIONS,
+    EVENT_POSITION_HISTORY,
+)
+from .serial import (
+    CommeoSerialManager,
+    ShutterStatusResponse,
+    ShutterResponse,
+    MoveSupersededError,
+    CommandNotAcknowledgedError,
+)
+from .history import PositionHistory
 from .setupmanager import SetupManager
 
 
@@ -43,10 +70,14 @@ async def async_setup_entry(
 
     serialDevice = hass.data[DOMAIN][CONF_DEVICE_PATH]
     serialManager:CommeoSerialManager = CommeoSerialManager(serialDevice)
+    hass.data[DOMAIN][DATA_MANAGER] = serialManager
+    # set once the gateway has been opened and all actors have been added
+    hass.data[DOMAIN][DATA_READY] = asyncio.Event()
 
     def async_setup_finished(actors):
         _LOGGER.info("Starting Adding Entities")
         c = CommeoCoordinator(hass, serialManager)
+        hass.data[DOMAIN][DATA_COORDINATOR] = c
         entities = list()
         for actorID in actors:
             shutter = CommeoEntity(c, actorID)
@@ -56,16 +87,74 @@ async def async_setup_entry(
         entities.sort(key=lambda x: x.name)
         async_add_entities(entities)
         _LOGGER.info(f"All actors have been added: {entities}")
+        hass.data[DOMAIN][DATA_READY].set()
 
         
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_MOVE_AND_WAIT,
+        {
+            vol.Required(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_TIMEOUT): cv.positive_float,
+        },
+        "async_move_and_wait",
+    )
+    platform.async_register_entity_service(
+        SERVICE_GET_POSITION_HISTORY,
+        {vol.Optional(ATTR_MOVES, default=10): vol.All(vol.Coerce(int), vol.Range(min=1))},
+        "async_get_position_history",
+    )
+
+    async def async_apply_scene(call):
+        try:
+            await asyncio.wait_for(hass.data[DOMAIN][DATA_READY].wait(), DISCOVERY_TIMEOUT)
+        except asyncio.TimeoutError as err:
+            raise HomeAssistantError("Commeo gateway is not ready yet") from err
+        coordinator:CommeoCoordinator = hass.data[DOMAIN][DATA_COORDINATOR]
+        await coordinator.applyScene(call.data[ATTR_POSITIONS])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCENE,
+        async_apply_scene,
+        schema=vol.Schema({
+            vol.Required(ATTR_POSITIONS): {cv.entity_id: vol.All(vol.Coerce(int), vol.Range(min=0, max=100))},
+        }),
+    )
+
     SetupManager(hass, serialManager, async_setup_finished)
-    await serialManager.setup(hass.loop)
 
-    await serialManager.recvMessage()
-    _LOGGER.info("Serial Setup")
-    await serialManager.requestActorIDs()
-    await serialManager.recvMessage()
+    async def async_start():
+        """Open the serial port and discover the actors, retrying until the gateway answers."""
+        ready:asyncio.Event = hass.data[DOMAIN][DATA_READY]
+        retryDelay = SETUP_RETRY_DELAY
+        while not ready.is_set():
+            try:
+                if not serialManager.isOpen:
+                    await serialManager.setup(hass.loop)
+                    _LOGGER.info("Serial Setup")
+                if await serialManager.requestActorIDs():
+                    deadline = hass.loop.time() + DISCOVERY_TIMEOUT
+                    while not ready.is_set() and hass.loop.time() < deadline:
+                        if serialManager.isReading:
+                            # discovery replies are read by the SetupManager
+                            await asyncio.sleep(serialManager.ackTimeout)
+                        else:
+                            await serialManager.recvMessage()
+            except Exception as err:
+                _LOGGER.warning("Commeo gateway setup failed: %s" % str(err))
+                serialManager.close()
+            if not ready.is_set():
+                _LOGGER.warning(f"Commeo gateway not ready, retrying in {retryDelay} s")
+                await asyncio.sleep(retryDelay)
+                retryDelay = min(retryDelay * 2, SETUP_RETRY_MAX_DELAY)
+        _LOGGER.info("Commeo gateway ready")
+
+    # a background task so HA startup does not wait for the gateway
+    hass.data[DOMAIN][DATA_SETUP_TASK] = entry.async_create_background_task(
+        hass, async_start(), "commeo_setup"
+    )
 
 """
     # Fetch initial data so we have data when entities subscribe
@@ -92,7 +181,7 @@ class CommeoCoordinator(DataUpdateCoordinator):
         )
         self.actors = dict[int, CommeoEntity]()
         self.manager:CommeoSerialManager = manager
-        self.manager.setEventHandlers(self.eventActorsReceived, self.eventActorInitialised, self.eventActorUpdate, self.eventMessageReceivingDone)
+        self.manager.setEventHandlers(self.eventActorsReceived, self.eventActorInitialised, self.eventActorUpdate, self.eventMessageReceivingDone, self.eventCommandFailed)
 
     def getActor(self, actorID) -> ShutterResponse:
         return self.manager.actorInfo[actorID]
@@ -100,9 +189,46 @@ class CommeoCoordinator(DataUpdateCoordinator):
     def getActorStatus(self, actorID) -> ShutterStatusResponse:
         return self.manager.actorStatus[actorID]
 
+    def getActorHistory(self, actorID) -> PositionHistory:
+        return self.manager.actorHistory[actorID]
+
     def add_entity(self, actorID:int, shutter):
         self.actors[actorID] = shutter
 
+    async def applyScene(self, positions):
+        """Drive covers to positions given as {entity_id: HA position}."""
+        entities = {entity.entity_id: entity for entity in self.actors.values()}
+        unknown = set(positions).difference(entities)
+        if unknown:
+            raise HomeAssistantError(f"Not a Commeo cover: {', '.join(sorted(unknown))}")
+
+        actorPositions = {
+            entities[entityID].actorID: CommeoEntity.reversePosition(position)
+            for entityID, position in positions.items()
+        }
+        groups = self.manager.planScene(actorPositions)
+        for pos, actorIDs in groups.items():
+            for actorID in actorIDs:
+                self.actors[actorID].setOptimisticState(CommeoEntity.reversePosition(pos))
+
+        try:
+            results = await self.manager.requestScene(groups)
+        except Exception:
+            for actorIDs in groups.values():
+                for actorID in actorIDs:
+                    self.actors[actorID].rollbackOptimisticState()
+            raise
+        failed = set()
+        for actorIDs, isAcknowledged in results.values():
+            if not isAcknowledged:
+                failed.update(actorIDs)
+        for actorID in failed:
+            self.actors[actorID].rollbackOptimisticState()
+        _LOGGER.info(f"Scene applied with {len(groups)} frames for {sum(len(ids) for ids in groups.values())} actors")
+        if failed:
+            names = ", ".join(sorted(self.actors[actorID].name for actorID in failed))
+            raise HomeAssistantError(f"Gateway did not acknowledge the scene for {names}")
+
     async def _async_update_data(self):
         """Fetch data from API endpoint.
 
@@ -121,6 +247,12 @@ class CommeoCoordinator(DataUpdateCoordinator):
     def eventActorInitialised(self, actorID:str):
         return
 
+    def eventCommandFailed(self, failedActorIDs):
+        for actorID in failedActorIDs:
+            if actorID in self.actors:
+                _LOGGER.info(f"Rolling back optimistic state of actor {actorID}")
+                self.actors[actorID].rollbackOptimisticState()
+
     def eventActorUpdate(self, updatedActorID:str, isCreate):
         _LOGGER.info(f"Try Updating actor {updatedActorID}")
         if not isCreate:
@@ -145,10 +277,16 @@ class CommeoEntity(CoordinatorEntity, CoverEntity):
         self.actor:ShutterResponse = coordinator.getActor(actorID)
         self._attr_name = self.actor.actorText
         self._attr_unique_id = self.actor.radioAddress
+        # Status the optimistic state was derived from; None if not optimistic.
+        self.optimisticBaseStatus:ShutterStatusResponse = None
         self.update_attr()
 
     def update_attr(self):
         actorStatus:ShutterStatusResponse = self.coordinator.getActorStatus(self.actorID)
+        if self.optimisticBaseStatus is actorStatus:
+            # no new status from the gateway yet, keep the optimistic state
+            return
+        self.optimisticBaseStatus = None
         adjPos = CommeoEntity.reversePosition(actorStatus.getCurrentPosition())
 
         self._attr_current_cover_position = adjPos
@@ -156,6 +294,29 @@ class CommeoEntity(CoordinatorEntity, CoverEntity):
         self._attr_is_closed= actorStatus.isClosed()
         self._attr_is_closing= actorStatus.isClosing()
         self._attr_is_opening= actorStatus.isOpening()
+        self._attr_extra_state_attributes = {
+            "target_position": CommeoEntity.reversePosition(actorStatus.getTargetPosition())
+        }
+
+    def setOptimisticState(self, targetPosition):
+        """Show the expected movement until the gateway reports the real state.
+        targetPosition uses the HA scale, 100 is fully open, 0 is closed.
+        Call it before sending the command so feedback does not wait for the gateway.
+        """
+        currentPosition = self._attr_current_cover_position
+        self.optimisticBaseStatus = self.coordinator.getActorStatus(self.actorID)
+        self._attr_is_opening = targetPosition > currentPosition
+        self._attr_is_closing = targetPosition < currentPosition
+        self._attr_is_closed = False if self._attr_is_opening else self._attr_is_closed
+        self._attr_extra_state_attributes = {"target_position": targetPosition}
+        self.async_write_ha_state()
+
+    def rollbackOptimisticState(self):
+        if self.optimisticBaseStatus is None:
+            return
+        self.optimisticBaseStatus = None
+        self.update_attr()
+        self.async_write_ha_state()
         
     @staticmethod
     def reversePosition(pos):
@@ -172,23 +333,62 @@ class CommeoEntity(CoordinatorEntity, CoverEntity):
         self.async_write_ha_state()
 
 
+    async def sendCommand(self, command):
+        """Await a command sent after setOptimisticState, roll back if the gateway did not take it."""
+        try:
+            isAcknowledged = await command
+        except Exception:
+            self.rollbackOptimisticState()
+            raise
+        if not isAcknowledged:
+            self.rollbackOptimisticState()
+            raise HomeAssistantError(f"Gateway did not acknowledge the command for {self.name}")
+
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
         _LOGGER.info("Driving UP///////////")
-        return await self.actor.driveUp()
+        self.setOptimisticState(100)
+        await self.sendCommand(self.actor.driveUp())
 
     async def async_close_cover(self, **kwargs):
         """Close cover."""
         _LOGGER.info("Driving Down///////////")
-        return await self.actor.driveDown()
+        self.setOptimisticState(0)
+        await self.sendCommand(self.actor.driveDown())
 
     async def async_set_cover_position(self, **kwargs):
         """Move the cover to a specific position."""
         _LOGGER.info("setting Pos///////////")
         position = CommeoEntity.reversePosition(kwargs.get(ATTR_POSITION))
-        return await self.actor.drivePos(position)
+        self.setOptimisticState(kwargs.get(ATTR_POSITION))
+        await self.sendCommand(self.actor.drivePos(position))
 
     async def async_stop_cover(self, **kwargs):
         """Stop the cover."""
         _LOGGER.info("setting Stop///////////")
-        return await self.actor.stop()
\ No newline at end of file
+        self.setOptimisticState(self._attr_current_cover_position)
+        await self.sendCommand(self.actor.stop())
+
+    async def async_move_and_wait(self, position, timeout=None):
+        """Move the cover to a position and wait until it has stopped there."""
+        _LOGGER.info("setting Pos and waiting///////////")
+        self.setOptimisticState(position)
+        try:
+            move = await self.actor.drivePosAndWait(CommeoEntity.reversePosition(position))
+        except Exception:
+            self.rollbackOptimisticState()
+            raise
+        try:
+            await asyncio.wait_for(move, timeout or self.coordinator.manager.moveTimeout)
+        except asyncio.TimeoutError as err:
+            raise HomeAssistantError(f"{self.name} did not reach position {position} in time") from err
+        except MoveSupersededError as err:
+            raise HomeAssistantError(f"Move of {self.name} was superseded by another command") from err
+        except CommandNotAcknowledgedError as err:
+            self.rollbackOptimisticState()
+            raise HomeAssistantError(f"Gateway did not acknowledge the command for {self.name}") from err
+
+    async def async_get_position_history(self, moves):
+        """Fire an event with the recent moves and travel statistics of the cover."""
+        summary = self.coordinator.getActorHistory(self.actorID).summary(moves)
+        self.hass.bus.async_fire(EVENT_POSITION_HISTORY, {"entity_id": self.entity_id, **summary})
@@ -0,0 +1,29 @@
+"""Diagnostics support for the Commeo Integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_MANAGER
+from .serial import CommeoSerialManager
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    manager:CommeoSerialManager = hass.data[DOMAIN].get(DATA_MANAGER)
+    if manager is None:
+        return {"actors": {}}
+
+    actors = dict()
+    for actorID, history in manager.actorHistory.items():
+        info = manager.actorInfo.get(actorID)
+        actors[actorID] = {
+            "name": info.actorText if info is not None else None,
+            "status": repr(manager.actorStatus.get(actorID)),
+            "history": history.summary(),
+        }
+    return {"actors": actors}
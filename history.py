@@ -0,0 +1,120 @@
+"""Fixed-size position history of a single actor."""
+import array
+import time
+
+STATE_STILL = 1
+STATE_OPENING = 2
+STATE_CLOSING = 3
+
+
+class PositionHistory:
+    """Ring buffer of (monotonic time, state, current position, target position).
+
+    Positions are stored as reported by ShutterStatusResponse,
+    100 is closed, 0 is fully open.
+    """
+
+    def __init__(self, capacity=256, stallTolerance=5):
+        self.capacity = capacity
+        self.stallTolerance = stallTolerance
+        self.times = array.array('d', [0.0]) * capacity
+        self.states = array.array('B', [0]) * capacity
+        self.currentPositions = array.array('B', [0]) * capacity
+        self.targetPositions = array.array('B', [0]) * capacity
+        # 1 if a stop command was sent after the sample was recorded
+        self.stopRequested = array.array('B', [0]) * capacity
+        self.nextIndex = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def record(self, state, currentPosition, targetPosition, timestamp=None):
+        index = self.nextIndex
+        self.times[index] = time.monotonic() if timestamp is None else timestamp
+        self.states[index] = state
+        self.currentPositions[index] = currentPosition
+        self.targetPositions[index] = targetPosition
+        self.stopRequested[index] = 0
+        self.nextIndex = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def recordStop(self):
+        """Flag the latest sample with a sent stop command, so the move is not taken for a stall."""
+        if self.count == 0:
+            return
+        self.stopRequested[(self.nextIndex - 1) % self.capacity] = 1
+
+    def entries(self):
+        """Yield the recorded samples from oldest to newest."""
+        start = (self.nextIndex - self.count) % self.capacity
+        for offset in range(self.count):
+            index = (start + offset) % self.capacity
+            yield (self.times[index], self.states[index], self.currentPositions[index], self.targetPositions[index], self.stopRequested[index])
+
+    def moves(self):
+        """Return all completed moves, a move starts when the actor leaves
+        the still state and ends when it reports being still again.
+
+        Once the buffer has wrapped, a move that started before the first
+        still sample is left out, its start has been overwritten. A move is stalled if it
+        stopped short of its target without a stop command being sent.
+        """
+        moves = list()
+        move = None
+        # the oldest samples of a wrapped buffer may be the middle of a move
+        seenStill = self.count < self.capacity
+        for timestamp, state, currentPosition, targetPosition, stopRequested in self.entries():
+            if state != STATE_STILL:
+                if move is None:
+                    move = {
+                        "start": timestamp,
+                        "direction": "closing" if state == STATE_CLOSING else "opening",
+                        "startPosition": currentPosition,
+                        "stopped": False,
+                        "truncated": not seenStill,
+                    }
+                move["targetPosition"] = targetPosition
+                move["stopped"] = move["stopped"] or stopRequested == 1
+            elif move is None:
+                seenStill = True
+            else:
+                seenStill = True
+                if not move.pop("truncated"):
+                    move["duration"] = timestamp - move["start"]
+                    move["endPosition"] = currentPosition
+                    move["stalled"] = not move["stopped"] and abs(currentPosition - move["targetPosition"]) > self.stallTolerance
+                    moves.append(move)
+                move = None
+        return moves
+
+    def lastMoves(self, n):
+        return self.moves()[-n:] if n > 0 else []
+
+    def averageTravelTime(self):
+        """Return the average duration of all moves that reached their target in seconds."""
+        durations = [move["duration"] for move in self.moves() if not move["stalled"] and not move["stopped"]]
+        if len(durations) == 0:
+            return None
+        return sum(durations) / len(durations)
+
+    def stalls(self):
+        """Return the moves that stopped short of their target without a stop command."""
+        return [move for move in self.moves() if move["stalled"]]
+
+    def summary(self, n=10):
+        now = time.monotonic()
+        def describe(move):
+            described = dict(move)
+            described["secondsAgo"] = round(now - described.pop("start"), 1)
+            described["duration"] = round(described["duration"], 1)
+            return described
+        return {
+            "samples": self.count,
+            "lastMoves": [describe(move) for move in self.lastMoves(n)],
+            "averageTravelTime": self.averageTravelTime(),
+            "stalls": [describe(move) for move in self.stalls()],
+        }
+
+    def __repr__(self):
+        return "<PositionHistory samples:%s capacity:%s>" % (self.count, self.capacity)
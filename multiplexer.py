@@ -0,0 +1,132 @@
+"""Share one Commeo gateway stick between several clients over TCP.
+
+The multiplexer owns the serial port and speaks the gateway protocol to
+every connected client. Event frames from the gateway are broadcast to all
+clients, responses are routed back to the client that sent the request and
+all writes go through the transmit window of one CommeoSerialManager.
+
+Run it with
+    python -m custom_components.commeo.multiplexer /dev/ttyUSB0 --port 7000
+and configure the integration with the device path socket://<host>:7000.
+Home Assistant does not need to be installed on the multiplexer host,
+only pyserial-asyncio and xmltodict.
+"""
+import argparse
+import asyncio
+import logging
+
+from .const import DEFAULT_MULTIPLEXER_PORT, SETUP_RETRY_DELAY, SETUP_RETRY_MAX_DELAY
+from .serial import CommeoSerialManager, Response
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommeoMultiplexer:
+    def __init__(self, manager:CommeoSerialManager, host, port):
+        self.manager = manager
+        self.host = host
+        self.port = port
+        self.clients = set()
+        self.manager.setEventHandlers(self.eventActorsReceived, self.eventActorInitialised, self.eventActorUpdate, self.eventMessageReceivingDone, self.eventCommandFailed)
+        self.manager.frameListener = self.eventFrameReceived
+
+    async def start(self, loop):
+        await self.manager.setup(loop)
+        self.server = await asyncio.start_server(self.handleClient, self.host, self.port)
+        self.readTask = loop.create_task(self.readLoop())
+        _LOGGER.info(f"Multiplexer listening on {self.host}:{self.port}")
+
+    async def serveForever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def readLoop(self):
+        while True:
+            if self.manager.isReading:
+                # the sender is reading while it waits for an acknowledgement
+                await asyncio.sleep(self.manager.ackTimeout)
+                continue
+            try:
+                await self.manager.recvMessage()
+            except Exception as err:
+                _LOGGER.exception("error processing gateway message: %s" % str(err))
+                await asyncio.sleep(self.manager.ackTimeout)
+            if self.manager.isConnectionLost():
+                await self.reconnect()
+
+    async def reconnect(self):
+        """Reopen the gateway connection after it was closed, e.g. the stick was unplugged."""
+        _LOGGER.error("Gateway connection lost, reopening it")
+        self.manager.close()
+        retryDelay = SETUP_RETRY_DELAY
+        while True:
+            await asyncio.sleep(retryDelay)
+            try:
+                await self.manager.setup(asyncio.get_running_loop())
+                return
+            except Exception as err:
+                retryDelay = min(retryDelay * 2, SETUP_RETRY_MAX_DELAY)
+                _LOGGER.error(f"Reopening the gateway failed, retrying in {retryDelay} s: {err}")
+
+    async def handleClient(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter):
+        _LOGGER.info(f"Client connected: {writer.get_extra_info('peername')}")
+        self.clients.add(writer)
+        try:
+            while True:
+                msg = await reader.readuntil(b'\n\n')
+                try:
+                    msg = msg.decode('ascii').strip()
+                    if msg:
+                        await self.manager.send(msg, writer)
+                except UnicodeError as err:
+                    _LOGGER.warning(f"Dropping invalid frame from {writer.get_extra_info('peername')}: {err}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            _LOGGER.info(f"Client disconnected: {writer.get_extra_info('peername')}")
+            self.clients.discard(writer)
+            writer.close()
+
+    def eventFrameReceived(self, msg, resp:Response, ackedFrame):
+        data = msg.encode('utf-8')
+        if ackedFrame is not None:
+            if ackedFrame.origin in self.clients:
+                ackedFrame.origin.write(data)
+        elif resp.rootKey == Response.CALL_KEY:
+            for client in self.clients:
+                client.write(data)
+
+    def eventMessageReceivingDone(self, isTimeout):
+        return
+
+    def eventActorsReceived(self):
+        return
+
+    def eventActorInitialised(self, actorID:str):
+        return
+
+    def eventActorUpdate(self, updatedActorID:str, isCreate):
+        return
+
+    def eventCommandFailed(self, failedActorIDs):
+        return
+
+
+async def runMultiplexer(serialPort, host, port):
+    multiplexer = CommeoMultiplexer(CommeoSerialManager(serialPort), host, port)
+    await multiplexer.start(asyncio.get_running_loop())
+    await multiplexer.serveForever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Share a Commeo gateway between several clients over TCP.")
+    parser.add_argument("device", help="serial port of the gateway stick")
+    parser.add_argument("--host", default="0.0.0.0", help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_MULTIPLEXER_PORT, help="TCP port to listen on")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(runMultiplexer(args.device, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
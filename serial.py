@@ -1,45 +1,20 @@
-## Hassio imports
 import logging
 from typing import Dict, Set
-from homeassistant.components.cover import (
-    SUPPORT_OPEN,
-    SUPPORT_CLOSE,
-    SUPPORT_SET_POSITION,
-    SUPPORT_STOP,
-    ATTR_POSITION,
-)
-
-from homeassistant.const import (
-    SERVICE_OPEN_COVER,
-    SERVICE_CLOSE_COVER,
-    SERVICE_SET_COVER_POSITION,
-    SERVICE_STOP_COVER,
-    SERVICE_TOGGLE,
-    SERVICE_OPEN_COVER_TILT,
-    SERVICE_CLOSE_COVER_TILT,
-    SERVICE_STOP_COVER_TILT,
-    SERVICE_SET_COVER_TILT_POSITION,
-    SERVICE_TOGGLE_COVER_TILT,
-    STATE_OPEN,
-    STATE_CLOSED,
-    STATE_OPENING,
-    STATE_CLOSING,
-)
 
 ### Async
 
 import asyncio
+import collections
 import serial_asyncio
-import concurrent.futures
 import serial
 
-import time
-import xmltodict
-import json
-import base64
-import sys
 import math
 
+# xmltodict, json and base64 are imported where they are used to keep
+# loading this module cheap during Home Assistant startup
+
+from .history import PositionHistory
+
 _LOGGER = logging.getLogger(__name__)
 
 STOP_COMMAND = 0
@@ -51,6 +26,19 @@ DRIVE_POS_COMMAND = 7
 MAX_DRIVE_POS_VALUE = 65535
 
 
+def toCommeoValue(pos):
+    """Convert a position in percent, 100 is closed, to the gateway's value range."""
+    return math.ceil(pos * MAX_DRIVE_POS_VALUE / 100)
+
+
+class MoveSupersededError(Exception):
+    """A tracked move was replaced by a newer command for the same actor."""
+
+
+class CommandNotAcknowledgedError(Exception):
+    """The gateway did not acknowledge a command for a tracked move."""
+
+
 class ShutterResponse:
     def __init__(self, manager, response):
         self.resp = response
@@ -81,17 +69,22 @@ class ShutterResponse:
         return self.actorTyp == 1 and self.actorStatus == 1
 
     async def driveUp(self):
-        await self.manager.requestShutterCommand(self.actorID, DRIVE_UP_COMMAND, 0)
+        return await self.manager.requestShutterCommand(self.actorID, DRIVE_UP_COMMAND, 0)
 
     async def driveDown(self):
-        await self.manager.requestShutterCommand(self.actorID, DRIVE_DOWN_COMMAND, 0)
+        return await self.manager.requestShutterCommand(self.actorID, DRIVE_DOWN_COMMAND, 0)
 
     async def stop(self):
-        await self.manager.requestShutterCommand(self.actorID, STOP_COMMAND, 0)
+        return await self.manager.requestShutterCommand(self.actorID, STOP_COMMAND, 0)
 
     async def drivePos(self, pos):
-        adjustedPos = math.ceil(pos * MAX_DRIVE_POS_VALUE / 100)
-        await self.manager.requestShutterCommand(self.actorID, DRIVE_POS_COMMAND, adjustedPos)
+        adjustedPos = toCommeoValue(pos)
+        return await self.manager.requestShutterCommand(self.actorID, DRIVE_POS_COMMAND, adjustedPos)
+
+    async def drivePosAndWait(self, pos):
+        """Drive to pos and return a future resolving once the actor is still there."""
+        adjustedPos = toCommeoValue(pos)
+        return await self.manager.requestShutterMove(self.actorID, DRIVE_POS_COMMAND, adjustedPos)
 
     def __repr__(self):
         return "<ShutterResponse text:%s id:%s>" % (self.actorText, self.actorID)
@@ -114,6 +107,10 @@ class ShutterStatusResponse:
     def isStill(self):
         return self.resp.getInt(1) == 1
 
+    def getState(self):
+        """Return the raw state, 1 is still, 2 is opening and 3 is closing."""
+        return self.resp.getInt(1)
+
     def isClosed(self):
         return self.isStill() and self.resp.getInt(3) == MAX_DRIVE_POS_VALUE and self.currentPositionNearlyClosed()
 
@@ -126,6 +123,19 @@ class ShutterStatusResponse:
     def currentPositionNearlyFullyOpen(self):
         return self.resp.getInt(2) < (0 + self.getToleranceValue())
 
+    def isStillAt(self, commeoValue, tolerance=None):
+        """Return True if the actor is still and near the given raw position.
+        A commeoValue of None matches any still position. tolerance is in raw
+        units and defaults to the closing gap tolerance.
+        """
+        if not self.isStill():
+            return False
+        if commeoValue is None:
+            return True
+        if tolerance is None:
+            tolerance = self.getToleranceValue()
+        return abs(self.resp.getInt(2) - commeoValue) <= tolerance
+
     def getToleranceValue(self):
         return int(MAX_DRIVE_POS_VALUE*self.closingGapTolerance)
 
@@ -157,12 +167,14 @@ class Response:
     CALL_KEY = "methodCall"
 
     def __init__(self, xmlStr):
+        import xmltodict
         self.content = xmltodict.parse(xmlStr)
         if self.RESP_KEY in self.content:
             self.rootKey = self.RESP_KEY
         elif self.CALL_KEY in self.content: 
             self.rootKey = self.CALL_KEY
         else:
+            import json
             raise Exception(f'Unkown Response Format:\n{json.dumps(self.content)}\n')
 
     def isFault(self):
@@ -178,6 +190,7 @@ class Response:
         return self.base64ToIntSet(b64List)
 
     def base64ToIntSet(self, b64Str):
+        import base64
         mybyte = base64.b64decode(b64Str)
         byteNum = int.from_bytes(mybyte, byteorder="little")
         bitStr = "{0:b}".format(byteNum)
@@ -205,26 +218,70 @@ class Response:
             return self.content[self.rootKey]["methodName"]
 
     def __repr__(self):
+        import json
         return "<ShutterResponse response:%s>" % (json.dumps(self.content))
 
 
+class SentFrame:
+    """A frame written to the gateway that still awaits its methodResponse."""
+
+    def __init__(self, msg, origin=None):
+        # who asked for this frame, used to route the response back
+        self.origin = origin
+        start = msg.find('<methodName>') + len('<methodName>')
+        self.methodName = msg[start:msg.find('</methodName>')]
+        self.data = (msg+'\n\n').encode('ascii')
+        self.sentAt = 0
+        self.retransmits = 0
+        # resolves to True once acknowledged, False if dropped after maxRetransmits
+        self.acknowledged = asyncio.get_running_loop().create_future()
+
+    def setAcknowledged(self, isAcknowledged):
+        if not self.acknowledged.done():
+            self.acknowledged.set_result(isAcknowledged)
+
+    def __repr__(self):
+        return "<SentFrame methodName:%s retransmits:%s>" % (self.methodName, self.retransmits)
+
+
 class CommeoSerialManager:
-    def __init__(self, serialPort,):
+    def __init__(self, serialPort, transmitWindow=2):
         self.serialPort = serialPort
         self.availableActors = set()
         self.actorInfo:Dict(str, ShutterResponse) = dict()
         self.actorStatus:Dict[str, ShutterStatusResponse] = dict()
+        self.isOpen = False
         self.isReading = False
         self.isWriting = False
-        self.writingQueue = asyncio.Queue()
+        self.writingQueue = collections.deque()
         self.readTimeout = 3
-        self.writeTimeout = 0.08
-
-    def setEventHandlers(self, eventActorsReceived, eventActorInitialised, eventActorUpdate, eventMessageReceivingDone):
+        # number of frames that may be sent before the gateway acknowledged them.
+        # Responses only name the method, so at most one frame per method is in flight.
+        self.transmitWindow = transmitWindow
+        self.ackTimeout = 0.5
+        self.maxRetransmits = 2
+        self.unackedFrames = collections.deque()
+        self.ackReceived = asyncio.Event()
+        self.frameQueued = asyncio.Event()
+        self.readFinished = asyncio.Event()
+        self.writerTask:asyncio.Task = None
+        self.ackReader:asyncio.Task = None
+        # called with (msg, resp, ackedFrame) for every received message
+        self.frameListener = None
+        self.moveTimeout = 120
+        # actorID -> (future, raw target position) of moves awaited via requestShutterMove
+        self.pendingMoves:Dict[int, tuple] = dict()
+        self.historySize = 256
+        # actors closer than this raw distance to a scene position are not driven
+        self.sceneTolerance = MAX_DRIVE_POS_VALUE // 100
+        self.actorHistory:Dict[int, PositionHistory] = dict()
+
+    def setEventHandlers(self, eventActorsReceived, eventActorInitialised, eventActorUpdate, eventMessageReceivingDone, eventCommandFailed):
         self.eventActorsReceived = eventActorsReceived
         self.eventActorInitialised = eventActorInitialised
         self.eventActorUpdate = eventActorUpdate
         self.eventMessageReceivingDone = eventMessageReceivingDone
+        self.eventCommandFailed = eventCommandFailed
 
     async def setup(self, loop):
         try:
@@ -238,49 +295,131 @@ class CommeoSerialManager:
                 bytesize=serial.EIGHTBITS)
         except Exception as e:            
             _LOGGER.error ('error open serial port: ' + str(e))
-            raise "Serial Connection could not be opened!"
+            raise ConnectionError("Serial Connection could not be opened!") from e
+        self.isOpen = True
         _LOGGER.info("Serial Connection Opened!")
 
-    async def send(self, msg):
-        msg = msg+'\n\n'
-        msg = msg.encode('ascii')
-        
-        await self.writingQueue.put(msg)
-        if not self.isWriting:
-            self.isWriting = True
-            try:
-                while not self.writingQueue.empty():
-                    nextMsg = await self.writingQueue.get()
-                    _LOGGER.info(f"--- Sent ---\n{nextMsg}\n")
-                    self.writer.write(nextMsg)
-                    await self.writer.drain()
-                    await asyncio.sleep(self.writeTimeout)
-            except Exception as err:
-                _LOGGER.exception("error during send: %s" % str(err))
-                _LOGGER.error("error-causing msg: %s" % msg)
-            finally:
-                self.isWriting = False        
-
-    async def recvMessage(self):
+    def isConnectionLost(self):
+        """Return True if the port was closed or the stream hit EOF or a read error, e.g. the stick was unplugged."""
+        return not self.isOpen or self.reader.at_eof() or self.reader.exception() is not None
+
+    def close(self):
+        for task in (self.writerTask, self.ackReader):
+            if task is not None:
+                task.cancel()
+        if self.isOpen:
+            self.writer.close()
+            self.isOpen = False
+            _LOGGER.info("Serial Connection Closed!")
+
+    async def send(self, msg, origin=None):
+        """Queue msg for the gateway.
+        Return True once the gateway acknowledged it, False if it was dropped.
+        """
+        frame = SentFrame(msg, origin)
+        self.writingQueue.append(frame)
+        self.frameQueued.set()
+        if self.writerTask is None or self.writerTask.done():
+            self.writerTask = asyncio.get_running_loop().create_task(self.transmitLoop())
+        return await frame.acknowledged
+
+    async def transmitLoop(self):
+        """Write queued frames within the transmit window until all are acknowledged or dropped.
+        Runs in its own task so a cancelled caller of send does not stop it.
+        """
+        self.isWriting = True
+        try:
+            while self.writingQueue or self.unackedFrames:
+                try:
+                    while self.canTransmitNext():
+                        nextFrame = self.writingQueue.popleft()
+                        self.unackedFrames.append(nextFrame)
+                        await self.transmit(nextFrame)
+                    if self.unackedFrames:
+                        await self.waitForAck()
+                except Exception as err:
+                    # keep draining, frames that were not written are retransmitted or dropped
+                    _LOGGER.exception("error during send: %s" % str(err))
+        finally:
+            self.isWriting = False
+            # only left over if the task was cancelled, e.g. on close
+            for frame in list(self.unackedFrames) + list(self.writingQueue):
+                frame.setAcknowledged(False)
+            self.unackedFrames.clear()
+            self.writingQueue.clear()
+
+    def canTransmitNext(self):
+        """Return True if the next queued frame fits the window and no frame of its method awaits an acknowledgement."""
+        if not self.writingQueue or len(self.unackedFrames) >= self.transmitWindow:
+            return False
+        methodName = self.writingQueue[0].methodName
+        return all(frame.methodName != methodName for frame in self.unackedFrames)
+
+    async def transmit(self, frame:SentFrame):
+        _LOGGER.info(f"--- Sent ---\n{frame.data}\n")
+        self.writer.write(frame.data)
+        await self.writer.drain()
+        frame.sentAt = asyncio.get_running_loop().time()
+
+    async def waitForAck(self):
+        """Wait until the oldest unacknowledged frame is acknowledged or timed out."""
+        oldest:SentFrame = self.unackedFrames[0]
+        remaining = oldest.sentAt + self.ackTimeout - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            self.unackedFrames.popleft()
+            if oldest.retransmits < self.maxRetransmits:
+                oldest.retransmits += 1
+                _LOGGER.warning(f"No acknowledgement for {oldest}, retransmitting")
+                self.unackedFrames.append(oldest)
+                await self.transmit(oldest)
+            else:
+                _LOGGER.error(f"No acknowledgement for {oldest}, dropping it")
+                oldest.setAcknowledged(False)
+            return
+
+        self.ackReceived.clear()
+        self.frameQueued.clear()
+        self.readFinished.clear()
+        if not self.isReading:
+            # read in a separate task so that newly queued frames can wake the writer
+            self.ackReader = asyncio.get_running_loop().create_task(self.readAck(remaining))
+        # a finished read wakes the writer too, so it can start reading again
+        waiters = [asyncio.ensure_future(event.wait()) for event in (self.ackReceived, self.frameQueued, self.readFinished)]
+        try:
+            await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def readAck(self, timeout):
+        try:
+            await self.recvMessage(timeout)
+        except Exception as err:
+            _LOGGER.exception("error processing acknowledgement: %s" % str(err))
+
+    async def recvMessage(self, timeout=None):
         if self.isReading:
             return
         self.isReading = True
         msg = ''    
         try:
-            msg = await asyncio.wait_for(self.reader.readuntil(b'\n\n'), self.readTimeout)
+            msg = await asyncio.wait_for(self.reader.readuntil(b'\n\n'), timeout or self.readTimeout)
         except asyncio.TimeoutError:
             self.isReading = False
+            self.readFinished.set()
             _LOGGER.info("COMMEO Timeout")
             _LOGGER.info(f'--- Received ---\n{msg}')
             self.eventMessageReceivingDone(True)
             return
         except Exception as err:
             self.isReading = False
+            self.readFinished.set()
             _LOGGER.exception("error during recv: %s" % str(err))
             _LOGGER.error("error-causing block: %s" % msg)
             self.eventMessageReceivingDone(False)
             return
         self.isReading = False
+        self.readFinished.set()
         msg = msg.decode("utf-8")
         msg = msg[msg.find('<'):]
         myMsg = msg
@@ -292,6 +431,11 @@ class CommeoSerialManager:
         
     def processMessage(self, msg):
         resp = Response(msg)
+        ackedFrame = None
+        if resp.rootKey == Response.RESP_KEY:
+            ackedFrame = self.processAck(resp)
+        if self.frameListener is not None:
+            self.frameListener(msg, resp, ackedFrame)
         if resp.isFault():
             _LOGGER.error("Received FAULT: %s" % resp.getFaultMessage())
             return
@@ -300,6 +444,7 @@ class CommeoSerialManager:
            "selve.GW.device.getIDs": {"func": self.processActorIDs, "hasActor": False},
             "selve.GW.device.getInfo": {"func": self.processActorInfo, "hasActor": True},
             "selve.GW.command.device": {"func": self.discard, "hasActor": False},
+            "selve.GW.command.groupMan": {"func": self.discard, "hasActor": False},
             "selve.GW.command.result": {"func": self.processCommandResult, "hasActor": False},
             "selve.GW.device.getValues": {"func": self.processShutterStatus, "hasActor": True},
             "selve.GW.event.device": {"func": self.processShutterStatus, "hasActor": True},
@@ -307,14 +452,26 @@ class CommeoSerialManager:
             "selve.GW.event.log": {"func": self.processLog, "hasActor": False},
         }
         methodName = resp.getMethodName()
-        if factory[methodName]["hasActor"]:
+        handler = factory.get(methodName)
+        if handler is None:
+            _LOGGER.info("Unkown methodName: %s" % methodName)
+            return
+        if handler["hasActor"]:
             _LOGGER.info(f'--- Received ---: {methodName} -- actorID: {resp.getInt(0)}')
         else:
             _LOGGER.info(f'--- Received ---: {methodName}')
-        if methodName in factory:
-            factory[methodName]["func"](resp)
-        else:
-            _LOGGER.info("Unkown methodName: %s" % methodName)
+        handler["func"](resp)
+
+    def processAck(self, resp):
+        """Match a methodResponse to the unacknowledged frame of that method."""
+        methodName = None if resp.isFault() else resp.getMethodName()
+        for frame in self.unackedFrames:
+            if methodName is None or frame.methodName == methodName:
+                self.unackedFrames.remove(frame)
+                frame.setAcknowledged(True)
+                self.ackReceived.set()
+                return frame
+        return None
 
     def processCommandResult(self, resp):
         _LOGGER.info(f"Full Command Resp: {resp}")
@@ -329,6 +486,9 @@ class CommeoSerialManager:
         isError = resp.getInt(2) == 0
         succeeded = resp.getBase64(0)
         failed = resp.getBase64(1)
+        if len(failed) > 0:
+            self.eventCommandFailed(set(failed))
+
         if len(succeeded) == 1:
             succeeded = succeeded.pop()
 
@@ -387,23 +547,130 @@ class CommeoSerialManager:
         id = resp.actorID
         isCreate = id not in self.actorStatus
         self.actorStatus[id] = resp
+        if id not in self.actorHistory:
+            self.actorHistory[id] = PositionHistory(self.historySize)
+        self.actorHistory[id].record(resp.getState(), resp.getCurrentPosition(), resp.getTargetPosition())
+        self.resolvePendingMove(resp)
         self.eventActorUpdate(id, isCreate)
+
+    def resolvePendingMove(self, resp:ShutterStatusResponse):
+        if resp.actorID not in self.pendingMoves:
+            return
+        future, target = self.pendingMoves[resp.actorID]
+        if not future.done() and resp.isStillAt(target):
+            _LOGGER.info(f"Move of actor {resp.actorID} completed: {resp}")
+            future.set_result(resp)
+
+    def cancelPendingMove(self, actorID):
+        pending = self.pendingMoves.pop(actorID, None)
+        if pending is not None and not pending[0].done():
+            _LOGGER.info(f"Move of actor {actorID} superseded by a new command")
+            pending[0].set_exception(MoveSupersededError(actorID))
     
     def discard(self, resp):
         return
     
     async def requestActorIDs(self):
-        await self.send('<methodCall><methodName>selve.GW.device.getIDs</methodName></methodCall>')
+        return await self.send('<methodCall><methodName>selve.GW.device.getIDs</methodName></methodCall>')
         
     async def requestActorInfo(self, actorID):
-        await self.send('<methodCall><methodName>selve.GW.device.getInfo</methodName><array><int>%s</int></array></methodCall>' % (actorID))
+        return await self.send('<methodCall><methodName>selve.GW.device.getInfo</methodName><array><int>%s</int></array></methodCall>' % (actorID))
+
+    async def requestShutterMove(self, actorID, command, parameter):
+        """Send a shutter command and return a future for its completion.
+
+        The future resolves with the ShutterStatusResponse once the actor
+        reports being still at the target position. It fails with
+        MoveSupersededError if another command for the actor is sent first
+        and with CommandNotAcknowledgedError if the gateway dropped the
+        command. The future never times out by itself, wrap it in
+        asyncio.wait_for (e.g. with moveTimeout) where it is awaited.
+        Callers that do not await it do not get unretrieved exception warnings.
+        """
+        targets = {
+            STOP_COMMAND: None,
+            DRIVE_UP_COMMAND: 0,
+            DRIVE_DOWN_COMMAND: MAX_DRIVE_POS_VALUE,
+            DRIVE_POS_COMMAND: parameter,
+        }
+        target = targets[command]
+        self.cancelPendingMove(actorID)
+        future = asyncio.get_running_loop().create_future()
+        self.pendingMoves[actorID] = (future, target)
+
+        def removePendingMove(doneFuture):
+            if self.pendingMoves.get(actorID, (None,))[0] is doneFuture:
+                del self.pendingMoves[actorID]
+            # mark the exception as retrieved for callers that never await the move
+            if not doneFuture.cancelled():
+                doneFuture.exception()
+        future.add_done_callback(removePendingMove)
+
+        isAcknowledged = await self.sendShutterCommand(actorID, command, parameter)
+        if not future.done():
+            if not isAcknowledged:
+                future.set_exception(CommandNotAcknowledgedError(actorID))
+            elif actorID in self.actorStatus:
+                # the actor might not move at all if it already is at the target
+                self.resolvePendingMove(self.actorStatus[actorID])
+        return future
 
     async def requestShutterCommand(self, actorID, command, parameter):
+        self.cancelPendingMove(actorID)
+        return await self.sendShutterCommand(actorID, command, parameter)
+
+    async def sendShutterCommand(self, actorID, command, parameter):
+        if command == STOP_COMMAND and actorID in self.actorHistory:
+            self.actorHistory[actorID].recordStop()
         _LOGGER.info('<methodCall><methodName>selve.GW.command.device</methodName><array><int>%s</int><int>%s</int><int>%s</int><int>%s</int></array></methodCall>' % (actorID, command, 1, parameter))
-        await self.send('<methodCall><methodName>selve.GW.command.device</methodName><array><int>%s</int><int>%s</int><int>%s</int><int>%s</int></array></methodCall>' % (actorID, command, 1, parameter))
+        return await self.send('<methodCall><methodName>selve.GW.command.device</methodName><array><int>%s</int><int>%s</int><int>%s</int><int>%s</int></array></methodCall>' % (actorID, command, 1, parameter))
+
+    def encodeActorMask(self, actorIDs):
+        """Encode actor ids as the gateway's base64 bit mask, the inverse of Response.base64ToIntSet."""
+        mask = 0
+        for actorID in actorIDs:
+            mask |= 1 << actorID
+        import base64
+        return base64.b64encode(mask.to_bytes(8, byteorder="little")).decode('ascii')
+
+    async def requestGroupCommand(self, actorIDs, command, parameter):
+        """Send one command to several actors with a single radio frame."""
+        for actorID in actorIDs:
+            self.cancelPendingMove(actorID)
+        mask = self.encodeActorMask(actorIDs)
+        _LOGGER.info(f"Group command {command} with parameter {parameter} for actors {sorted(actorIDs)}")
+        return await self.send('<methodCall><methodName>selve.GW.command.groupMan</methodName><array><int>%s</int><int>%s</int><base64>%s</base64><int>%s</int></array></methodCall>' % (command, 1, mask, parameter))
+
+    def planScene(self, positions):
+        """Group actors by target position in percent (100 is closed).
+
+        Actors already still at their target, within one percent, are left
+        out. Returns a dict of positions to the set of actor ids to drive there.
+        """
+        groups:Dict[int, Set[int]] = dict()
+        for actorID, pos in positions.items():
+            target = toCommeoValue(pos)
+            status = self.actorStatus.get(actorID)
+            if status is not None and status.isStillAt(target, self.sceneTolerance):
+                continue
+            groups.setdefault(pos, set()).add(actorID)
+        return groups
+
+    async def requestScene(self, groups):
+        """Send one frame per group planned by planScene.
+
+        Returns a dict of the positions to the set of actor ids driven
+        there and whether the gateway acknowledged the frame.
+        """
+        positions = list(groups)
+        acknowledged = await asyncio.gather(*[
+            self.requestGroupCommand(groups[pos], DRIVE_POS_COMMAND, toCommeoValue(pos))
+            for pos in positions
+        ])
+        return {pos: (groups[pos], isAcknowledged) for pos, isAcknowledged in zip(positions, acknowledged)}
 
     async def requestShutterStatus(self, actorID):
-        await self.send('<methodCall><methodName>selve.GW.device.getValues</methodName><array><int>%s</int></array></methodCall>' % (actorID))
+        return await self.send('<methodCall><methodName>selve.GW.device.getValues</methodName><array><int>%s</int></array></methodCall>' % (actorID))
 
     async def __repr__(self):
         return "<CommeoSerialManager \n\tavailableActors: %s\n\actorInfo: %s\n\actorStatus: %s\n>" % (self.availableActors, self.actorInfo, self.actorStatus )
@@ -18,13 +18,16 @@ class SetupManager():
         self.partialInitializedActors:Set(str) = set[str]()
         self.uninitializedActors:Set(str) = set[str]()
         self.serialManager:CommeoSerialManager = serialManager
-        self.serialManager.setEventHandlers(self.eventActorsReceived, self.eventActorInitialised, self.eventActorUpdate, self.eventMessageReceivingDone)
+        self.serialManager.setEventHandlers(self.eventActorsReceived, self.eventActorInitialised, self.eventActorUpdate, self.eventMessageReceivingDone, self.eventCommandFailed)
         self.async_setup_finished = async_setup_finished
         
     def eventMessageReceivingDone(self, isTimeout):
         if not isTimeout:
             self.hass.async_create_task(self.serialManager.recvMessage())
 
+    def eventCommandFailed(self, failedActorIDs):
+        return
+
     def eventActorsReceived(self):
         if self.getAllActors() != self.serialManager.availableActors:
             self.uninitializedActors = self.serialManager.availableActors.difference(self.getAllActors())